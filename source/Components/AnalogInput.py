@@ -1,12 +1,12 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from Components.Input import Input
 
 if TYPE_CHECKING:
     from Sources.Source import Source
 
-from Components.Component import Component
+from Components.Component import Component, _UNSET
 
 
 class AnalogInput(Input):
@@ -15,8 +15,8 @@ class AnalogInput(Input):
         super().__init__(source, component_id, component_address)
         self.state = 0
 
-    def check(self) -> float:
-        return super(AnalogInput, self).check()
+    def check(self, value: Any = _UNSET) -> float:
+        return super(AnalogInput, self).check(value)
 
     @staticmethod
     def get_type() -> Component.Type:
@@ -1,16 +1,17 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from Components.Input import Input
 
 if TYPE_CHECKING:
     from Sources.Source import Source
 
-from Components.Component import Component
+from Components.Component import Component, _UNSET
 
 
 class BinaryInput(Input):
 
+    # Results of check are plain ints rather than an Enum so comparing them is a cheap int comparison
     NO_CHANGE = 0
     ENTERED = 1
     EXIT = 2
@@ -19,19 +20,14 @@ class BinaryInput(Input):
         super().__init__(source, component_id, component_address)
         self.state = False
 
-    def check(self) -> int:
-        value = self.source.read_component(self.id)
-        if value == self.state:
-            repeat = True
-        else:
-            repeat = False
+    def check(self, value: Any = _UNSET) -> int:
+        if value is _UNSET:
+            value = self.source.read_component(self.id)
+        changed = value != self.state
         self.state = value
-        if value and not repeat:
-            return self.ENTERED
-        elif not value and not repeat:
-            return self.EXIT
-        else:
+        if not changed:
             return self.NO_CHANGE
+        return self.ENTERED if value else self.EXIT
 
     # For simulation control
     def toggle(self, on: bool) -> None:
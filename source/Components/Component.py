@@ -8,6 +8,8 @@ from enum import Enum
 from Sources.Source import Source
 from typing import Any
 
+_UNSET = object()  # Default for check when no pre-read value is provided since None can be a valid reading
+
 
 class Component:
     __metaclass__ = ABCMeta
@@ -64,8 +66,8 @@ class Component:
         return self.source.read_component(self.id)
 
     def initialize(self, metadata: Dict) -> None:
-        for key in metadata:
-            setattr(self, key, metadata[key])
+        for key, value in metadata.items():
+            setattr(self, key, value)
 
     def get_state(self) -> Any:
         return self.state
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from Sources.Source import Source
 
-from Components.Component import Component
+from Components.Component import Component, _UNSET
 
 
 class Input(Component):
@@ -13,8 +13,9 @@ class Input(Component):
         self.state = None
         super().__init__(source, component_id, component_address)
 
-    def check(self) -> Any:
-        value = self.source.read_component(self.id)
+    def check(self, value: Any = _UNSET) -> Any:
+        if value is _UNSET:
+            value = self.source.read_component(self.id)
         self.state = value
         return self.state
 
@@ -1,9 +1,10 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from Sources.Source import Source
 
 from Components.BinaryInput import BinaryInput
+from Components.Component import _UNSET
 
 
 class OEBinaryInput(BinaryInput):
@@ -13,10 +14,11 @@ class OEBinaryInput(BinaryInput):
         self.rising = True
         self.falling = False
 
-    def check(self) -> int:
-        json_strs = self.source.read_component(self.id)
-        if len(json_strs) > 0:
-            for json_str in reversed(json_strs):
+    def check(self, value: Any = _UNSET) -> int:
+        if value is _UNSET:
+            value = self.source.read_component(self.id)
+        if len(value) > 0:
+            for json_str in reversed(value):
                 if self.rising and self.falling:
                     if not self.state and json_str['metaData']['Direction'] == '1' and json_str['data']:
                         self.state = True
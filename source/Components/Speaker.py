@@ -1,12 +1,47 @@
+import functools
 import pygame
 import math
 import numpy
+import queue
 import threading
 import time
+import traceback
 
 from Components.Component import Component
 
 
+def _build_tone(frequency, n_samples, sample_rate, max_sample):
+    # An integer frequency repeats exactly every sample_rate / gcd(sample_rate, frequency) samples so only one period
+    # of the sine wave needs to be evaluated and the rest of the buffer can be tiled from it
+    if float(frequency).is_integer() and frequency > 0:
+        n_period = min(n_samples, sample_rate // math.gcd(sample_rate, int(frequency)))
+    else:
+        n_period = n_samples
+    # Evaluate the sine wave in place on a single working array so no intermediate arrays are allocated
+    wave = numpy.arange(n_period, dtype=numpy.float64)
+    numpy.multiply(wave, 2 * math.pi * frequency / sample_rate, out=wave)
+    numpy.sin(wave, out=wave)
+    numpy.multiply(wave, max_sample, out=wave)
+    numpy.rint(wave, out=wave)
+    # Repeat the period to fill the (mono) buffer
+    return numpy.resize(wave.astype(numpy.int16), n_samples)
+
+
+@functools.lru_cache(maxsize=64)
+def _tone_sound(frequency, volume=1.0, sample_rate=22050, channels=1):
+    # Tones are replayed with the same parameters across trials so each Sound is only built once. The volume is part
+    # of the key so it is set before the Sound is ever played
+    # max_sample = 2**(bits - 1) - 1
+    max_sample = 128.0
+    n_samples = int(sample_rate)  # Number of sample to generate
+    buf = _build_tone(frequency, n_samples, sample_rate, max_sample)
+    if channels > 1:  # Only duplicate the signal if the mixer was opened with more than one channel elsewhere
+        buf = numpy.repeat(buf[:, None], channels, axis=1)
+    sound = pygame.sndarray.make_sound(buf)
+    sound.set_volume(volume)  # volume value 0.0 to 1.0
+    return sound
+
+
 class Speaker(Component):  # Not implemented
     """
         Class defining a Speaker component in the operant chamber.
@@ -19,8 +54,6 @@ class Speaker(Component):  # Not implemented
             The ID of this Component
         component_address : str
             The location of this Component for its Source
-        metadata : str
-            String containing any metadata associated with this Component
 
         Attributes
         ----------
@@ -30,74 +63,79 @@ class Speaker(Component):  # Not implemented
         Methods
         -------
             play_sound(frequency, volume, duration)
-                Plays a 16 bit sound with a sampling rate of 22050 with the provided frequency and volume lasting the provided duration
+                Plays a 16 bit sound at the mixer sampling rate with the provided frequency and volume lasting the provided duration
             play_sound_file(music_file, volume)
-                Plays a 16 bit sound with a sampling rate of 44100 saved in music_file with the provided volume
+                Plays a sound saved in music_file with the provided volume
             get_state()
                 Returns state
             get_type()
                 Returns Component.Type.DIGITAL_OUTPUT
         """
-    def __init__(self, source, component_id, component_address, metadata=""):
+    def __init__(self, source, component_id, component_address):
         self.state = False
-        super().__init__(source, component_id, component_address, metadata)
+        self.end_time = None  # Time the current tone ends or None while a sound file is playing
+        super().__init__(source, component_id, component_address)
+        # Initialize the mixer once rather than on every call since reinitializing tears down the audio device
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init(22050, -16, 1, 512)  # The same signal is played on every channel so mono suffices
+            except pygame.error:  # No audio device is available so sounds will not be played
+                pass
+        # Start a worker thread for this Speaker rather than spawning a thread for every sound
+        self.queue = queue.SimpleQueue()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
+
+    def _worker_loop(self):
+        while True:
+            request = self.queue.get()
+            if request is None:  # The Speaker was closed
+                return
+            play, args = request
+            try:
+                play(*args)
+            except Exception:
+                traceback.print_exc()
 
     def play_sound(self, frequency, volume, duration):
-        th = threading.Thread(target=self._play_sound, args=(frequency, volume, duration))
-        th.start()
+        self.queue.put((self._play_sound, (frequency, volume, duration)))
 
     def _play_sound(self, frequency, volume, duration):
-        sample_rate = 22050
-        bits = 16
-
-        pygame.mixer.pre_init(sample_rate, -bits, 2)
-
-        n_samples = int(sample_rate)  # Number of sample to generate
-
-        # set up our numpy array to handle 16 bit ints, which is what we set our mixer to expect with "bits" up above
-        buf = numpy.zeros((n_samples, 2), dtype=numpy.int16)
-        # max_sample = 2**(bits - 1) - 1
-        max_sample = 128.0
-        for s in range(n_samples):
-            t = float(s) / sample_rate  # time in seconds
-            # grab the x-coordinate of the sine wave at a given time, while constraining the sample to what our mixer is set to with "bits"
-            buf[s][0] = int(round(max_sample * math.sin(2 * math.pi * float(frequency) * t)))  # left
-            buf[s][1] = int(round(max_sample * math.sin(2 * math.pi * float(frequency) * t)))  # right
-
-        sound = pygame.sndarray.make_sound(buf)
+        mixer = pygame.mixer.get_init()
+        if not mixer:
+            return
+        sample_rate, _, channels = mixer
+        sound = _tone_sound(float(frequency), float(volume), sample_rate, channels)
         # play once, then loop until duration has passed
-        sound.set_volume(float(volume))  # volume value 0.0 to 1.0
         play_time = int(duration * 1000)  # Duration in sec, need ms
-        self.state = True
-        sound.play(loops=-1, maxtime=play_time)  # - 1 = loops forever, max time in ms
-        time.sleep(duration)
-        self.state = False
+        channel = sound.play(loops=-1, maxtime=play_time)  # - 1 = loops forever, max time in ms
+        if channel is not None:
+            self.end_time = time.perf_counter() + duration
+            self.state = True
 
     def play_sound_file(self, music_file, volume=0.8):
-        th = threading.Thread(target=self._play_sound_file, args=(music_file, volume))
-        th.start()
-        th.join()
-        self.state = False
+        self.queue.put((self._play_sound_file, (music_file, volume)))
 
     def _play_sound_file(self, music_file, volume):
-        # set up the mixer
-        freq = 44100  # audio CD quality
-        bitsize = -16  # unsigned 16 bit
-        channels = 2  # 1 is mono, 2 is stereo
-        buffer = 2048  # number of samples (experiment to get best sound)
-        pygame.mixer.init(freq, bitsize, channels, buffer)
-
+        if not pygame.mixer.get_init():
+            return
         # volume value 0.0 to 1.0
         pygame.mixer.music.set_volume(volume)
         try:
             pygame.mixer.music.load(music_file)
         except pygame.error:
             return
-        self.state = True
         pygame.mixer.music.play()
+        self.end_time = None
+        self.state = True
 
     def get_state(self):
-        return self.state
+        # Playback is asynchronous so check whether the current sound has finished. state is only written by the
+        # worker thread since this is called from both the task and GUI threads
+        return self.state and (pygame.mixer.music.get_busy() if self.end_time is None else time.perf_counter() < self.end_time)
+
+    def close(self):
+        self.queue.put(None)
+        super().close()
 
     def get_type(self):
         return Component.Type.DIGITAL_OUTPUT
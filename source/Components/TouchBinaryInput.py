@@ -1,8 +1,9 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from Sources.Source import Source
 from Components.BinaryInput import BinaryInput
+from Components.Component import _UNSET
 
 
 class TouchBinaryInput(BinaryInput):
@@ -12,25 +13,23 @@ class TouchBinaryInput(BinaryInput):
         super().__init__(source, component_id, component_address)
         self.pos = None
 
-    def check(self) -> int:
-        read = self.source.read_component(self.id)
-        if isinstance(read, tuple):
-            value = read[0]
-            pos = read[1]
+    def check(self, value: Any = _UNSET) -> int:
+        if value is _UNSET:
+            value = self.source.read_component(self.id)
+        if isinstance(value, tuple):
+            touched = value[0]
+            pos = value[1]
         else:
-            value = read
+            touched = value
             pos = None
 
-        if value == self.state:
-            repeat = True
-        else:
-            repeat = False
-        self.state = value
-        if value and not repeat:
+        changed = touched != self.state
+        self.state = touched
+        if not changed:
+            return self.NO_CHANGE
+        elif touched:
             self.pos = pos
             return self.ENTERED
-        elif not value and not repeat:
+        else:
             self.pos = None
             return self.EXIT
-        else:
-            return self.NO_CHANGE
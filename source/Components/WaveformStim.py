@@ -18,19 +18,24 @@ class WaveformStim(Stimmer):
         self.sr = None
 
     def parametrize(self, pnum: int, _, per: int, dur: int, amps: np.ndarray, durs: list[int]) -> None:
-        waveforms = np.zeros((amps.shape[0], math.ceil(dur/1000000*self.sr) + 1))
+        n_total = math.ceil(dur/1000000*self.sr)
+        n_per = math.ceil(per / 1000000 * self.sr)
+        n_durs = [math.floor(d / 1000000 * self.sr) for d in durs[:amps.shape[1]]]
+        n_pulse = sum(n_durs)
+        waveforms = np.zeros((amps.shape[0], n_total + 1))
         ns = 0
-        while ns < math.ceil(dur/1000000*self.sr):
+        while ns < n_total:
+            # Never write a partial pulse since a truncated pulse would be unbalanced
+            if ns + n_pulse > n_total + 1:
+                raise IndexError("Stimulation pulse extends past the end of the waveform")
             sw = 0
-            for i in range(amps.shape[1]):
-                for j in range(math.floor(durs[i] / 1000000 * self.sr)):
-                    for k in range(amps.shape[0]):
-                        waveforms[k, ns] = amps[k, i]
-                    ns += 1
-                sw += math.floor(durs[i] / 1000000 * self.sr)
-            ns += math.ceil(per / 1000000 * self.sr) - sw
-        for i in range(amps.shape[0]):
-            waveforms[i, -1] = 0
+            for i, n in enumerate(n_durs):
+                # Fill every channel for the full width of this phase at once
+                waveforms[:, ns:ns + n] = amps[:, i:i + 1]
+                ns += n
+                sw += n
+            ns += n_per - sw
+        waveforms[:, -1] = 0
         self.configs[pnum] = waveforms
 
     def start(self, pnum: int, stype: str = None) -> None:
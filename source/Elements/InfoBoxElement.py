@@ -25,6 +25,10 @@ class InfoBoxElement(Element):
         self.pt2 = self.x+w, self.y
         self.pt3 = self.x+w, self.y+h
         self.pt4 = self.x, self.y+h
+        self.label_font = pygame.font.SysFont('arial', self.f_size, bold=True)
+        self.text_font = pygame.font.SysFont('arial', self.f_size)
+        self.rendered_text = None  # The text most recently rendered into text_surfaces
+        self.text_surfaces = []
 
     def get_text(self) -> list[str]:
         return self.text
@@ -37,8 +41,7 @@ class InfoBoxElement(Element):
         txt_color = (0, 0, 0)
 
         # WRITE LABEL
-        my_font = pygame.font.SysFont('arial', self.f_size, bold=True)
-        lbl_in_font = my_font.render(self.label, True, (0, 0, 0))
+        lbl_in_font = self.label_font.render(self.label, True, (0, 0, 0))
         lbl_ht = lbl_in_font.get_height()
         lbl_wd = lbl_in_font.get_width()
         if self.label_pos == 'BOTTOM':
@@ -57,10 +60,13 @@ class InfoBoxElement(Element):
         self.screen.blit(lbl_in_font, self.rect.move(lbl_x,  lbl_y+1))
 
         # WRITE TEXT
-        lines_in_txt = len(self.text)
+        # Only render the text again if it has changed since the last frame
+        if self.text != self.rendered_text:
+            self.rendered_text = list(self.text)
+            self.text_surfaces = [self.text_font.render(line, True, txt_color) for line in self.text]
+        lines_in_txt = len(self.text_surfaces)
         if lines_in_txt > 0:  # NOT EMPTY BOX, No info_boxes
-            my_font = pygame.font.SysFont('arial', self.f_size)
-            msg_in_font = my_font.render(self.text[0], True, (0, 0, 0))
+            msg_in_font = self.text_surfaces[0]
             msg_ht = msg_in_font.get_height()
             msg_wd = msg_in_font.get_width()
 
@@ -70,8 +76,7 @@ class InfoBoxElement(Element):
                 msg_x = +5 * self.SF  # MULTIPLE LINE INFO BOX: Indent 5 pixels from box left
 
             ln_count = 0
-            for line in self.text:
-                msg_in_font = my_font.render(line, True, txt_color)
+            for msg_in_font in self.text_surfaces:
                 msg_y = ln_count * msg_ht - 2 * self.SF
                 self.screen.blit(msg_in_font, self.rect.move(msg_x,  msg_y+1))
                 ln_count += 1
@@ -18,6 +18,8 @@ class Event:
             Any metadata related to the Event
     """
 
+    __slots__ = ('task', 'entry_time', 'metadata')
+
     def __init__(self, task: Task, metadata: Any = None):
         self.task = task
         self.entry_time = task.cur_time - task.start_time
@@ -17,6 +17,8 @@ class FinalStateEvent(Event):
         final_state : Enum
             Enumerated variable representing the final state
     """
+    __slots__ = ('final_state',)
+
     def __init__(self, task: Task, final_state: Enum, metadata: Any = None):
         super().__init__(task, metadata)
         self.final_state = final_state
@@ -18,6 +18,8 @@ class InputEvent(Event):
             Enumerated variable representing the type of input
     """
 
+    __slots__ = ('input_event',)
+
     def __init__(self, task: Task, input_event: Enum, metadata: Any = None):
         super().__init__(task, metadata)
         self.input_event = input_event
@@ -19,6 +19,8 @@ class StateChangeEvent(Event):
             Enumerated variable representing the new state of the Task
     """
 
+    __slots__ = ('initial_state', 'new_state')
+
     def __init__(self, task: Task, initial_state: Enum, new_state: Enum, metadata: Any = None):
         super().__init__(task, metadata)
         self.initial_state = initial_state
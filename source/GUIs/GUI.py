@@ -32,6 +32,9 @@ class GUI:
         raise NotImplementedError
 
     def handle_events(self, events: List[Event]) -> None:
+        if not events:
+            return
+        elements = self.get_elements()
         for event in events:
-            for el in self.get_elements():
+            for el in elements:
                 el.handle_event(event)
@@ -8,7 +8,6 @@ import os.path
 from Sources.Source import Source
 from Components.Component import Component
 import numpy as np
-import math
 from sklearn.gaussian_process import GaussianProcessRegressor
 from sklearn.gaussian_process.kernels import RBF
 from sklearn.utils.validation import check_is_fitted
@@ -104,11 +103,10 @@ class BayesContainer:
 
     def suggest(self):
         mean_prediction, std_prediction = self.gaussian_process.predict(self.test_params, return_std=True)
-        soft_max = np.cumsum(np.power(math.e, -(mean_prediction - std_prediction)) / np.sum(
-            np.power(math.e, -(mean_prediction - std_prediction))))
-        keys = list(self.param_ranges.keys())
+        weights = np.exp(std_prediction - mean_prediction)
+        soft_max = np.cumsum(weights / np.sum(weights))
         new_params = self.test_params[np.argmin(np.abs(soft_max - np.random.rand()))]
-        return collections.OrderedDict([(keys[i], new_params[i]) for i in range(len(new_params))])
+        return collections.OrderedDict(zip(self.param_ranges.keys(), new_params))
 
     def add_data(self, outcome, params: OrderedDict):
         self.outcome = np.append(self.outcome, outcome).reshape(-1, 1)
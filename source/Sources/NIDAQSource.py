@@ -91,18 +91,20 @@ class NIDAQSource(Source):
     def read_component(self, component_id):
         if self.available:
             # Do I need a stop here as well?
-            if self.components[component_id].get_type() == Component.Type.DIGITAL_INPUT:
+            component_type = self.components[component_id].get_type()
+            if component_type is Component.Type.DIGITAL_INPUT:
                 return self.tasks[component_id].read()
-            elif self.components[component_id].get_type() == Component.Type.ANALOG_INPUT:
+            elif component_type is Component.Type.ANALOG_INPUT:
                 return self.streams[component_id].read_one_sample(0)
         else:
             return None
 
     def write_component(self, component_id, msg):
         if self.available:
-            if self.components[component_id].get_type() == Component.Type.DIGITAL_OUTPUT:
+            component_type = self.components[component_id].get_type()
+            if component_type is Component.Type.DIGITAL_OUTPUT:
                 self.tasks[component_id].write(msg)
-            elif self.components[component_id].get_type() == Component.Type.ANALOG_OUTPUT:
+            elif component_type is Component.Type.ANALOG_OUTPUT:
                 output = np.zeros((len(self.ao_inds), msg.shape[1]))
                 output[self.ao_inds[component_id], :] = np.squeeze(msg)
                 if self.ao_task.is_task_done():
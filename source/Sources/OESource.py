@@ -51,9 +51,13 @@ class OESource(Source):
             time.sleep(5)
 
     def read_component(self, component_id):
+        return self.read_components([component_id])[0]
+
+    def read_components(self, component_ids):
+        # Drain the socket once and distribute the TTL events to every requested component
         self.last_read = time.perf_counter()
         sockets = self.poller.poll(self.delay)
-        jsonStrs = []
+        channels = {int(self.components[component_id].address) - 1: [] for component_id in component_ids}
         for socket in sockets:
             try:
                 while True:
@@ -63,12 +67,11 @@ class OESource(Source):
                     elif len(msg) == 2:
                         envelope, jsonStr = msg
                         jsonStr = json.loads(jsonStr.decode('utf-8'))
-                        if jsonStr['type'] == 'ttl' and jsonStr['channel'] == int(
-                                self.components[component_id].address) - 1:
-                            jsonStrs.append(jsonStr)
+                        if jsonStr['type'] == 'ttl' and jsonStr['channel'] in channels:
+                            channels[jsonStr['channel']].append(jsonStr)
             except ZMQError:
                 pass
-        return jsonStrs
+        return [channels[int(self.components[component_id].address) - 1] for component_id in component_ids]
 
     def write_component(self, component_id, msg):
         pass
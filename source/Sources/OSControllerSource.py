@@ -64,6 +64,15 @@ class OSControllerSource(Source):
         self.client.close()
 
     def read_component(self, component_id):
+        self.read_messages()
+        return self.values[component_id]
+
+    def read_components(self, component_ids):
+        self.read_messages()
+        return [self.values[component_id] for component_id in component_ids]
+
+    def read_messages(self):
+        # Apply all pending input messages from the controller to the stored component values
         msg = ""
         try:
             while True:
@@ -85,7 +94,6 @@ class OSControllerSource(Source):
                     self.values[self.input_ids[cid]] = int(comps[3])
                 elif comps[0] == 'GPIOIn':
                     self.values[self.input_ids[cid]] = not self.values[self.input_ids[cid]]
-        return self.values[component_id]
 
     def write_component(self, component_id, msg):
         # If the intended value for the component differs from the current value, change it
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, List
 if TYPE_CHECKING:
     from Components.Component import Component
     from Tasks.Task import Task
@@ -21,6 +21,8 @@ class Source:
         Safely closes any connections the Source or its components may have
     read_component(component_id)
         Queries the current input to the component described by component_id
+    read_components(component_ids)
+        Queries the current inputs to all the components described by component_ids in a single call
     write_component(component_id, msg)
         Sends data msg to the component described by component_id
     """
@@ -41,6 +43,9 @@ class Source:
     def read_component(self, component_id: str) -> Any:
         pass
 
+    def read_components(self, component_ids: List[str]) -> List[Any]:
+        return [self.read_component(component_id) for component_id in component_ids]
+
     def write_component(self, component_id: str, msg: Any) -> None:
         pass
 
@@ -47,6 +47,8 @@ class Task:
             Ends the task
         main_loop()
             Repeatedly called throughout the lifetime of the task. State transitions are executed within.
+        get_state_method(state)
+            Returns the method handling the provided state or None if the task does not define one
         get_variables()
             Abstract method defining all variables necessary for the task as a dictionary relating variable names to 
             default values.
@@ -75,6 +77,7 @@ class Task:
         self.started = False  # Boolean indicator if task has started
         self.time_into_trial = 0  # Tracks time into trial for pausing purposes
         self.time_paused = 0
+        self.state_methods = {}  # Maps each state to the method that handles it
 
         component_definition = self.get_components()
 
@@ -89,16 +92,17 @@ class Task:
             self.metadata = args[0].metadata
             self.components = []
             for component in args[1]:
-                if component.id.split('-')[0] in component_definition:
-                    if not hasattr(self, component.id.split('-')[0]):
-                        setattr(self, component.id.split('-')[0], component)
+                name = component.id.split('-')[0]
+                if name in component_definition:
+                    if not hasattr(self, name):
+                        setattr(self, name, component)
                     else:  # If the Component is part of an already registered list
                         # Update the list with the Component at the specified index
-                        if isinstance(getattr(self, component.id.split('-')[0]), list):
-                            getattr(self, component.id.split('-')[0]).append(component)
+                        registered = getattr(self, name)
+                        if isinstance(registered, list):
+                            registered.append(component)
                         else:
-                            setattr(self, component.id.split('-')[0],
-                                    [getattr(self, component.id.split('-')[0]), component])
+                            setattr(self, name, [registered, component])
                     self.components.append(component)
             # Load protocol is provided
             if len(args) > 2 and args[2] is not None:
@@ -226,7 +230,7 @@ class Task:
             setattr(self, key, value)
         self.start()
         self.started = True
-        self.entry_time = self.start_time = self.cur_time = time.time()
+        self.entry_time = self.start_time = self.cur_time = time.perf_counter()
         self.events.append(InitialStateEvent(self, self.state))
 
     def start(self) -> None:
@@ -244,7 +248,7 @@ class Task:
     def resume__(self) -> None:
         self.resume()
         self.paused = False
-        time_temp = time.time()
+        time_temp = time.perf_counter()
         self.time_paused += time_temp - self.cur_time
         self.cur_time = time_temp
         self.entry_time = self.cur_time - self.time_into_trial
@@ -262,12 +266,18 @@ class Task:
         pass
 
     def main_loop(self) -> None:
-        self.cur_time = time.time()
+        self.cur_time = time.perf_counter()
         self.handle_input()
-        if hasattr(self, self.state.name):
-            state_method = getattr(self, self.state.name)
+        state_method = self.get_state_method(self.state)
+        if state_method is not None:
             state_method()
 
+    def get_state_method(self, state: Enum) -> Any:
+        # Resolve the method named after the state once and reuse it on subsequent loops
+        if state not in self.state_methods:
+            self.state_methods[state] = getattr(self, state.name, None)
+        return self.state_methods[state]
+
     def handle_input(self) -> None:
         pass
 
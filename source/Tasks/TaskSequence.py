@@ -78,15 +78,15 @@ class TaskSequence(Task):
         self.events.extend(sub_events)
 
     def main_loop(self) -> None:
-        self.cur_time = time.time()
-        self.cur_task.cur_time = self.cur_time
-        self.cur_task.handle_input()
+        cur_task = self.cur_task
+        self.cur_time = cur_task.cur_time = time.perf_counter()
+        cur_task.handle_input()
         self.handle_input()
-        if hasattr(self.cur_task, self.cur_task.state.name):
-            state_method = getattr(self.cur_task, self.cur_task.state.name)
+        state_method = cur_task.get_state_method(cur_task.state)
+        if state_method is not None:
             state_method()
-        if hasattr(self, self.state.name):
-            state_method = getattr(self, self.state.name)
+        state_method = self.get_state_method(self.state)
+        if state_method is not None:
             state_method()
         self.log_sequence_events()
 
@@ -1,13 +1,15 @@
+from collections.abc import Iterable, Mapping
+
+
 def dictionary_to_save_string(dic):
     if dic is not None:
-        save_string = ""
-        count = 0
-        for key in dic:
-            save_string += "{}={}".format(key, str(dic[key]))
-            if count < len(dic) - 1:
-                save_string += "|"
-            count += 1
-        return save_string
+        if isinstance(dic, Mapping):
+            return "|".join("{}={}".format(key, str(value)) for key, value in dic.items())
+        elif isinstance(dic, (set, frozenset)):  # Sort so the saved order does not depend on hashing
+            return "|".join(sorted(map(str, dic)))
+        elif isinstance(dic, Iterable) and not isinstance(dic, str):  # Separate with | so CSV columns are not split
+            return "|".join(map(str, dic))
+        else:
+            return str(dic)
     else:
         return None
-
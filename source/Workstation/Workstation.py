@@ -287,7 +287,8 @@ class Workstation:
             keys = list(self.thread_events.keys())
             for key in keys:
                 if key in self.thread_events and not self.thread_events[key][0].is_set():
-                    ecopy = self.tasks[key].events.copy()
+                    # Hand the current list to the loggers and give the task a fresh one rather than copying it
+                    ecopy = self.tasks[key].events
                     self.tasks[key].events = []
                     for el in self.event_loggers[key]:
                         if el.started:
@@ -310,18 +311,18 @@ class Workstation:
             events = pygame.event.get()  # Get mouse/keyboard events
             task_keys = list(self.tasks.keys())
             for key in task_keys:  # For each Task
-                keys = list(self.thread_events.keys())
-                if key in keys:
-                    if not self.thread_events[key][0].is_set():
-                        if key in self.thread_events and self.thread_events[key][3].is_set() and not self.tasks[key].paused:  # If the Task has been started and is not paused
+                thread_events = self.thread_events.get(key)
+                if thread_events is not None:
+                    if not thread_events[0].is_set():
+                        if thread_events[3].is_set() and not self.tasks[key].paused:  # If the Task has been started and is not paused
                             if len(self.tasks[key].events) > 0 and not self.event_notifier.is_set():
                                 self.event_notifier.set()
                             self.tasks[key].main_loop()  # Run the Task's logic loop
                             self.guis[key].handle_events(events)  # Handle mouse/keyboard events with the Task GUI
                             if self.tasks[key].is_complete():  # Stop the Task if it is complete
                                 self.wsg.chambers[key].stop()
-                    elif key in self.thread_events and not self.thread_events[key][2].is_set():
-                        self.thread_events[key][2].set()
+                    elif not thread_events[2].is_set():
+                        thread_events[2].set()
             time.sleep(0)
 
     def gui_loop(self) -> None: